@@ -1,17 +1,38 @@
 from __future__ import annotations
 
 import ast
+import codecs
+import hashlib
 import json
+import math
+import os
 import re
+import sys
+import tempfile
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from itertools import islice, repeat
 from pathlib import Path
 from typing import Any
 
+from aibom import __version__
 from aibom.confidence import score_confidence
 from aibom.detectors import DotNetAstDetector, GoAstDetector, JSTSAstDetector, JavaAstDetector
 from aibom.detectors.protocol import SourceDetector
 from aibom.risk.heuristics import generate_risk_findings
-from aibom.utils import git_sha, sha256_bytes, stable_json, utc_now
+from aibom.storage import load_json
+from aibom.utils import (
+    canonical_json_bytes,
+    display_path,
+    git_sha,
+    sha256_bytes,
+    stable_json_bytes,
+    utc_now,
+)
 
 FRAMEWORK_ALIASES: dict[str, set[str]] = {
     "langchain": {"langchain", "langchain_openai", "langchain_community", "langchain_core"},
@@ -20,10 +41,29 @@ FRAMEWORK_ALIASES: dict[str, set[str]] = {
     "openai": {"openai"},
     "anthropic": {"anthropic"},
 }
-MODEL_CLASS_HINTS = {"OpenAI", "ChatOpenAI", "HuggingFaceHub", "Ollama", "ChatAnthropic"}
-TOOL_HINTS = {"initialize_agent", "load_tools", "Tool", "AgentExecutor"}
-VECTORSTORE_HINTS = {"FAISS", "Chroma", "Pinecone"}
-PROMPT_HINTS = {"PromptTemplate", "ChatPromptTemplate"}
+# Import root / dependency name -> framework; the alias sets above are disjoint.
+FRAMEWORK_BY_ALIAS: dict[str, str] = {
+    alias: fw for fw, aliases in FRAMEWORK_ALIASES.items() for alias in aliases
+}
+MODEL_CLASS_HINTS = frozenset({"OpenAI", "ChatOpenAI", "HuggingFaceHub", "Ollama", "ChatAnthropic"})
+TOOL_HINTS = frozenset({"initialize_agent", "load_tools", "Tool", "AgentExecutor"})
+VECTORSTORE_HINTS = frozenset({"FAISS", "Chroma", "Pinecone"})
+PROMPT_HINTS = frozenset({"PromptTemplate", "ChatPromptTemplate"})
+# Call-name leaf -> detection kind; the hint sets above are disjoint.
+CALL_HINT_KINDS: dict[str, str] = {
+    **dict.fromkeys(MODEL_CLASS_HINTS, "model"),
+    **dict.fromkeys(TOOL_HINTS, "tool"),
+    **dict.fromkeys(PROMPT_HINTS, "prompt"),
+}
+# Evidence behind a model detection's "import" and "config_key" signals.
+MODEL_IMPORT_SIGNAL_ROOTS = frozenset(
+    {"openai", "anthropic", "langchain", "langchain_openai", "transformers"}
+)
+MODEL_CONFIG_SIGNAL_KWARGS = frozenset(
+    {"model", "model_name", "api_key", "provider", "openai_api_key"}
+)
+# Directory names never descended into when collecting Python sources.
+IGNORED_DIRS = frozenset({".venv", "venv", "__pycache__", ".git", ".aibom", ".tox", "node_modules"})
 CONFIG_GLOBS = ("*.yaml", "*.yml", "*.json", ".env")
 CONFIG_KEY_HINTS = {
     "model": "model configuration",
@@ -140,6 +180,61 @@ AI_RUNTIME_CONFIG_KEY_PATTERN = re.compile(
     r"(endpoint|base|url|api|key|token|model|deployment|version)?",
     re.IGNORECASE,
 )
+# Below this many Python files the process pool costs more to start than it saves.
+PARALLEL_SCAN_MIN_FILES = 32
+# Chunks handed to each worker: few enough to amortize IPC, enough to even out slow files.
+PARALLEL_SCAN_CHUNKS_PER_WORKER = 4
+# Worker processes each hold their own parsed trees, so memory, not cores, bounds the pool.
+PARALLEL_SCAN_MAX_WORKERS = 8
+# Overrides the detected worker count; 1 forces the serial path.
+SCAN_WORKERS_ENV = "AIBOM_SCAN_WORKERS"
+_CGROUP_ROOT = Path("/sys/fs/cgroup")
+# The serial path reads ahead on a few threads; the window bounds how many files sit in memory.
+SERIAL_SCAN_READ_WORKERS = 4
+SERIAL_SCAN_READ_AHEAD = 8
+# Scan cache entries unused this long are evicted by prune_scan_cache, run at most once a day.
+SCAN_CACHE_MAX_AGE_SEC = 30 * 24 * 3600
+SCAN_CACHE_PRUNE_INTERVAL_SEC = 24 * 3600
+# Cache entries are only valid for the visitor code that produced them.
+try:
+    _ANALYZER_SOURCE_SHA = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+except OSError:
+    _ANALYZER_SOURCE_SHA = __version__
+
+# Node types that can never contain an Import or a Call; the visitor does not descend into them.
+_LEAF_NODE_TYPES = frozenset(
+    {ast.Name, ast.Constant, ast.alias}.union(
+        *(
+            base.__subclasses__()
+            for base in (ast.expr_context, ast.boolop, ast.operator, ast.unaryop, ast.cmpop)
+        )
+    )
+)
+
+# Names the visitor can report on, minus those containing a shorter one or "agent".
+_HINT_NAMES = {
+    name.encode("ascii") for name in (*FRAMEWORK_BY_ALIAS, *CALL_HINT_KINDS, *VECTORSTORE_HINTS)
+}
+_SOURCE_NEEDLES = tuple(
+    sorted(
+        name
+        for name in _HINT_NAMES
+        if b"agent" not in name.lower()
+        and not any(other != name and other in name for other in _HINT_NAMES)
+    )
+)
+
+FileScan = tuple[
+    list[dict[str, Any]],
+    list[dict[str, Any]],
+    list[dict[str, Any]],
+    list[dict[str, Any]],
+    set[str],
+]
+# Returned in place of a FileScan for sources the byte prefilter rules out without parsing.
+PREFILTERED_SCAN: tuple[()] = ()
+# PEP 263 declaration; only looked for on the first two lines of a source.
+_CODING_COOKIE = re.compile(rb"^[ \t\f]*#.*?coding[:=][ \t]*([-\w.]+)", re.MULTILINE)
 
 
 @dataclass
@@ -160,11 +255,13 @@ class ScanContext:
     include_prompts: bool
     include_runtime_manifests: bool
     redaction_policy: str = "strict"
+    cache_dir: Path | None = None
 
 
 class AIBOMVisitor(ast.NodeVisitor):
     def __init__(self, file_path: Path, include_prompts: bool = False) -> None:
         self.file_path = file_path
+        self._file_ref = display_path(file_path)
         self.include_prompts = include_prompts
         self.models: list[dict[str, Any]] = []
         self.datasets: list[dict[str, Any]] = []
@@ -174,12 +271,33 @@ class AIBOMVisitor(ast.NodeVisitor):
         self.import_aliases: dict[str, str] = {}
         self.bindings: dict[str, str] = {}
 
+    def visit(self, node: ast.AST) -> None:
+        # Pre-order, source-order walk like ast.NodeVisitor, on an explicit stack.
+        dispatch = self._DISPATCH
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            handler = dispatch.get(type(current))
+            if handler is not None:
+                handler(self, current)
+            children: list[ast.AST] = []
+            for field_name in current._fields:
+                value = getattr(current, field_name, None)
+                if isinstance(value, list):
+                    for item in value:
+                        if isinstance(item, ast.AST) and type(item) not in _LEAF_NODE_TYPES:
+                            children.append(item)
+                elif isinstance(value, ast.AST) and type(value) not in _LEAF_NODE_TYPES:
+                    children.append(value)
+            if children:
+                children.reverse()
+                stack.extend(children)
+
     def visit_Import(self, node: ast.Import) -> Any:
         for alias in node.names:
             root = alias.name.split(".")[0]
             self._track_framework(root)
             self.import_aliases[alias.asname or root] = alias.name
-        self.generic_visit(node)
 
     def visit_ImportFrom(self, node: ast.ImportFrom) -> Any:
         if not node.module:
@@ -189,7 +307,6 @@ class AIBOMVisitor(ast.NodeVisitor):
             if alias.name == "*":
                 continue
             self.import_aliases[alias.asname or alias.name] = f"{node.module}.{alias.name}"
-        self.generic_visit(node)
 
     def visit_Assign(self, node: ast.Assign) -> Any:
         bound = self._bound_symbol(node.value)
@@ -197,21 +314,23 @@ class AIBOMVisitor(ast.NodeVisitor):
             for target in node.targets:
                 for target_name in self._target_names(target):
                     self.bindings[target_name] = bound
-        self.generic_visit(node)
 
     def visit_AnnAssign(self, node: ast.AnnAssign) -> Any:
         bound = self._bound_symbol(node.value)
         if bound:
             for target_name in self._target_names(node.target):
                 self.bindings[target_name] = bound
-        self.generic_visit(node)
 
     def visit_Call(self, node: ast.Call) -> Any:
         resolved_name = self._resolve_symbol(self._name_of(node.func))
-        leaf = resolved_name.split(".")[-1]
-        source_ref = f"{self.file_path}:{getattr(node, 'lineno', 0)}"
-        file_ref = str(self.file_path)
-        if leaf in MODEL_CLASS_HINTS:
+        if not resolved_name:
+            # Calls on subscripts, lambdas, etc. have no name for any hint to match.
+            return
+        name_parts = resolved_name.split(".")
+        leaf = name_parts[-1]
+        kind = CALL_HINT_KINDS.get(leaf)
+        file_ref = self._file_ref
+        if kind == "model":
             provider_endpoint = MODEL_PROVIDER_ENDPOINTS.get(leaf, PROVENANCE_UNKNOWN)
             self.models.append(
                 {
@@ -222,24 +341,33 @@ class AIBOMVisitor(ast.NodeVisitor):
                     "provenance": _provenance(provider_endpoint=provider_endpoint),
                 }
             )
-        if leaf in TOOL_HINTS or "agent" in leaf.lower():
+        if kind == "tool" or "agent" in leaf.lower():
             self.tools.append({"name": leaf, "source_file": file_ref})
-        if any(part in VECTORSTORE_HINTS for part in resolved_name.split(".")):
+        if not VECTORSTORE_HINTS.isdisjoint(name_parts):
             self.datasets.append({"type": resolved_name, "source_file": file_ref})
-        if leaf in PROMPT_HINTS:
-            entry = {"id": source_ref, "source_file": file_ref}
+        if kind == "prompt":
+            entry = {"id": f"{file_ref}:{getattr(node, 'lineno', 0)}", "source_file": file_ref}
             if self.include_prompts:
                 entry["template"] = self._arg_or_kw(node, "template", default="redacted")
             self.prompts.append(entry)
-        self.generic_visit(node)
 
     def _name_of(self, node: ast.AST) -> str:
-        if isinstance(node, ast.Name):
+        # Exact-type fast paths for ``name`` and ``module.attr``, the bulk of callees.
+        node_type = type(node)
+        if node_type is ast.Name:
             return node.id
-        if isinstance(node, ast.Attribute):
-            parent = self._name_of(node.value)
-            return f"{parent}.{node.attr}" if parent else node.attr
-        return ""
+        if node_type is ast.Attribute and type(node.value) is ast.Name:
+            return f"{node.value.id}.{node.attr}"
+        parts: list[str] = []
+        current = node
+        while isinstance(current, ast.Attribute):
+            parts.append(current.attr)
+            current = current.value
+        if isinstance(current, ast.Name):
+            parts.append(current.id)
+        # A non-name base (``factory().attr``) keeps just the attribute chain.
+        parts.reverse()
+        return ".".join(parts)
 
     def _resolve_symbol(self, name: str) -> str:
         if not name:
@@ -275,37 +403,37 @@ class AIBOMVisitor(ast.NodeVisitor):
 
     def _classification_signals(self, resolved_name: str, node: ast.Call) -> set[str]:
         signals: set[str] = {"constructor"}
-        root = resolved_name.split(".")[0]
-        if root in {"openai", "anthropic", "langchain", "langchain_openai", "transformers"}:
+        if resolved_name.partition(".")[0] in MODEL_IMPORT_SIGNAL_ROOTS:
             signals.add("import")
-        if any(
-            kw.arg in {"model", "model_name", "api_key", "provider", "openai_api_key"}
-            for kw in node.keywords
-            if kw.arg
-        ):
+        if not MODEL_CONFIG_SIGNAL_KWARGS.isdisjoint(kw.arg for kw in node.keywords):
             signals.add("config_key")
         return signals
 
     def _arg_or_kw(self, node: ast.Call, *keys: str, default: str = "unknown") -> str:
+        # ast.parse builds exact Constant/str types, so type() checks suffice.
         for kw in node.keywords:
-            if (
-                kw.arg in keys
-                and isinstance(kw.value, ast.Constant)
-                and isinstance(kw.value.value, str)
-            ):
-                return kw.value.value
-        if (
-            node.args
-            and isinstance(node.args[0], ast.Constant)
-            and isinstance(node.args[0].value, str)
-        ):
-            return node.args[0].value
+            if kw.arg in keys:
+                value = kw.value
+                if type(value) is ast.Constant and type(value.value) is str:
+                    return value.value
+        if node.args:
+            first = node.args[0]
+            if type(first) is ast.Constant and type(first.value) is str:
+                return first.value
         return default
 
     def _track_framework(self, root: str) -> None:
-        for fw, aliases in FRAMEWORK_ALIASES.items():
-            if root in aliases:
-                self.imported_frameworks.add(fw)
+        fw = FRAMEWORK_BY_ALIAS.get(root)
+        if fw is not None:
+            self.imported_frameworks.add(fw)
+
+    _DISPATCH: dict[type[ast.AST], Callable[[AIBOMVisitor, Any], Any]] = {
+        ast.Import: visit_Import,
+        ast.ImportFrom: visit_ImportFrom,
+        ast.Assign: visit_Assign,
+        ast.AnnAssign: visit_AnnAssign,
+        ast.Call: visit_Call,
+    }
 
 
 class PythonAstDetector:
@@ -315,16 +443,19 @@ class PythonAstDetector:
         result = ScanResult()
         candidates = find_python_files(context.target_dir)
         scanned = 0
-        for py_file in candidates:
-            try:
-                tree = ast.parse(py_file.read_text(encoding="utf-8"))
-            except Exception:
+        prefiltered = 0
+        file_scans = _analyze_files(
+            candidates, context.target_dir, context.include_prompts, context.cache_dir
+        )
+        for file_scan in file_scans:
+            if file_scan is None:
+                continue
+            if file_scan == PREFILTERED_SCAN:
+                prefiltered += 1
                 continue
             scanned += 1
-            rel = py_file.relative_to(context.target_dir)
-            visitor = AIBOMVisitor(rel, include_prompts=context.include_prompts)
-            visitor.visit(tree)
-            for model in visitor.models:
+            models, datasets, tools, prompts, frameworks = file_scan
+            for model in models:
                 model_signals = set(model.get("signals", []))
                 clean_model = {k: v for k, v in model.items() if k != "signals"}
                 result.models.append(clean_model)
@@ -339,19 +470,299 @@ class PythonAstDetector:
                         evidence=f"Model class {model['type']} detected in Python source.",
                     )
                 )
-            result.datasets.extend(visitor.datasets)
-            result.tools.extend(visitor.tools)
-            result.prompts.extend(visitor.prompts)
-            result.frameworks.update(visitor.imported_frameworks)
+            result.datasets.extend(datasets)
+            result.tools.extend(tools)
+            result.prompts.extend(prompts)
+            result.frameworks.update(frameworks)
         result.coverage = {
             "source_type": self.source_type,
             "artifacts_seen": len(candidates),
             "artifacts_scanned": scanned,
+            "artifacts_prefiltered": prefiltered,
             "default_confidence": "high",
         }
         return result
 
 
+def default_scan_cache_dir() -> Path:
+    """Return the per-user scan cache directory.
+
+    Kept outside scanned trees so a repository cannot ship entries that mask its own findings.
+
+    Returns:
+        ``$XDG_CACHE_HOME/aibom/scan``, or ``~/.cache/aibom/scan`` when the variable is unset.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "aibom" / "scan"
+
+
+def _scan_cache_key(rel: Path, source: bytes) -> str:
+    # The interpreter is part of the key: grammar and AST shape change between Python versions.
+    python_tag = f"py{sys.version_info[0]}.{sys.version_info[1]}"
+    digest = hashlib.sha256(
+        f"aibom/{__version__}\0{python_tag}\0{display_path(rel)}\0".encode("utf-8")
+    )
+    digest.update(_detection_fingerprint().encode("utf-8"))
+    digest.update(source)
+    return digest.hexdigest()
+
+
+def _detection_fingerprint() -> str:
+    # Read per key rather than frozen at import, so patched or extended tables miss the cache.
+    tables = (
+        sorted(FRAMEWORK_BY_ALIAS.items()),
+        sorted(CALL_HINT_KINDS.items()),
+        sorted(VECTORSTORE_HINTS),
+        sorted(MODEL_IMPORT_SIGNAL_ROOTS),
+        sorted(MODEL_CONFIG_SIGNAL_KWARGS),
+        sorted(MODEL_PROVIDER_ENDPOINTS.items()),
+    )
+    return f"{_ANALYZER_SOURCE_SHA}\0{tables!r}\0"
+
+
+def _load_cached_scan(cache_file: Path) -> FileScan | None:
+    try:
+        data = load_json(cache_file)
+        file_scan = (
+            data["models"],
+            data["datasets"],
+            data["tools"],
+            data["prompts"],
+            set(data["frameworks"]),
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    try:
+        # A hit marks the entry as recently used so prune_scan_cache keeps it.
+        os.utime(cache_file)
+    except OSError:
+        pass
+    return file_scan
+
+
+def prune_scan_cache(cache_dir: Path, max_age_sec: float = SCAN_CACHE_MAX_AGE_SEC) -> int:
+    """Delete scan cache entries that have not been used recently.
+
+    The directory is walked at most once per ``SCAN_CACHE_PRUNE_INTERVAL_SEC``; only the
+    cache's own ``*.json`` and ``*.tmp`` files are ever removed.
+
+    Args:
+        cache_dir: Scan cache directory, as passed to ``generate_aibom``.
+        max_age_sec: Entries not written or hit for this many seconds are deleted.
+
+    Returns:
+        The number of entries removed; 0 when pruning ran too recently or failed.
+    """
+    marker = cache_dir / ".last-prune"
+    now = time.time()
+    try:
+        if now - marker.stat().st_mtime < SCAN_CACHE_PRUNE_INTERVAL_SEC:
+            return 0
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return 0
+    try:
+        entries = os.scandir(cache_dir)
+    except OSError:
+        return 0
+    cutoff = now - max_age_sec
+    removed = 0
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith((".json", ".tmp")):
+                continue
+            try:
+                if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    removed += 1
+            except OSError:
+                continue
+    try:
+        marker.touch()
+    except OSError:
+        pass
+    return removed
+
+
+def _store_cached_scan(cache_file: Path, file_scan: FileScan) -> None:
+    models, datasets, tools, prompts, frameworks = file_scan
+    try:
+        payload = stable_json_bytes(
+            {
+                "models": models,
+                "datasets": datasets,
+                "tools": tools,
+                "prompts": prompts,
+                "frameworks": sorted(frameworks),
+            }
+        )
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, prefix=".", suffix=".tmp")
+    except (OSError, TypeError, ValueError):
+        # An unencodable entry or a read-only or full cache volume must never fail the scan.
+        return
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+        os.replace(tmp_name, cache_file)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
+def _analyze_file(
+    py_file: Path, root: Path, include_prompts: bool, cache_dir: Path | None = None
+) -> FileScan | tuple[()] | None:
+    # Module-level so it can be shipped to worker processes.
+    return _analyze_source(py_file, _read_source(py_file), root, include_prompts, cache_dir)
+
+
+def _read_source(py_file: Path) -> bytes | None:
+    try:
+        return py_file.read_bytes()
+    except OSError:
+        return None
+
+
+def _may_have_findings(source: bytes) -> bool:
+    # NFKC-equivalent identifiers and coding cookies (utf-7) can hide names from a byte scan.
+    if not source.isascii() or _declares_foreign_encoding(source):
+        return True
+    # Tools also match any call whose name contains "agent" in any case.
+    return b"agent" in source.lower() or any(needle in source for needle in _SOURCE_NEEDLES)
+
+
+def _declares_foreign_encoding(source: bytes) -> bool:
+    match = _CODING_COOKIE.search(b"\n".join(source.split(b"\n", 2)[:2]))
+    if match is None:
+        return False
+    try:
+        return codecs.lookup(match.group(1).decode("ascii")).name not in ("utf-8", "ascii")
+    except LookupError:
+        return True
+
+
+def _analyze_source(
+    py_file: Path,
+    source: bytes | None,
+    root: Path,
+    include_prompts: bool,
+    cache_dir: Path | None,
+) -> FileScan | tuple[()] | None:
+    if source is None:
+        return None
+    if not _may_have_findings(source):
+        return PREFILTERED_SCAN
+    rel = py_file.relative_to(root)
+    cache_file: Path | None = None
+    if cache_dir is not None and not include_prompts:
+        cache_file = cache_dir / f"{_scan_cache_key(rel, source)}.json"
+        cached = _load_cached_scan(cache_file)
+        if cached is not None:
+            return cached
+    try:
+        tree = ast.parse(source, filename=str(py_file))
+    except Exception:
+        return None
+    visitor = AIBOMVisitor(rel, include_prompts=include_prompts)
+    visitor.visit(tree)
+    file_scan = (
+        visitor.models,
+        visitor.datasets,
+        visitor.tools,
+        visitor.prompts,
+        visitor.imported_frameworks,
+    )
+    if cache_file is not None:
+        _store_cached_scan(cache_file, file_scan)
+    return file_scan
+
+
+def _analyze_files(
+    files: list[Path], root: Path, include_prompts: bool, cache_dir: Path | None = None
+) -> list[FileScan | tuple[()] | None]:
+    """Analyze files in input order, fanning out to a process pool for large trees."""
+    workers = scan_worker_count()
+    if workers > 1 and len(files) >= PARALLEL_SCAN_MIN_FILES:
+        chunksize = max(1, len(files) // (workers * PARALLEL_SCAN_CHUNKS_PER_WORKER))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(
+                    pool.map(
+                        _analyze_file,
+                        files,
+                        repeat(root),
+                        repeat(include_prompts),
+                        repeat(cache_dir),
+                        chunksize=chunksize,
+                    )
+                )
+        except (OSError, BrokenProcessPool):
+            # Sandboxes without working multiprocessing fall back to the serial path.
+            pass
+    return [
+        _analyze_source(py_file, source, root, include_prompts, cache_dir)
+        for py_file, source in _prefetch_sources(files)
+    ]
+
+
+def scan_worker_count() -> int:
+    """Return how many worker processes a parallel scan should use.
+
+    Returns:
+        ``$AIBOM_SCAN_WORKERS`` when set; otherwise the CPUs in the affinity mask, limited by
+        any cgroup CPU quota and capped at ``PARALLEL_SCAN_MAX_WORKERS``.
+    """
+    override = os.environ.get(SCAN_WORKERS_ENV, "").strip()
+    if override:
+        try:
+            return max(1, int(override))
+        except ValueError:
+            pass
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    quota = _cgroup_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, quota)
+    return max(1, min(cpus, PARALLEL_SCAN_MAX_WORKERS))
+
+
+def _cgroup_cpu_quota() -> int | None:
+    # cgroup v2 cpu.max, then v1 CFS quota; None when unlimited.
+    try:
+        quota, period = (_CGROUP_ROOT / "cpu.max").read_text(encoding="ascii").split()[:2]
+        if quota == "max":
+            return None
+        return max(1, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    try:
+        quota_us = int((_CGROUP_ROOT / "cpu" / "cpu.cfs_quota_us").read_text(encoding="ascii"))
+        period_us = int((_CGROUP_ROOT / "cpu" / "cpu.cfs_period_us").read_text(encoding="ascii"))
+    except (OSError, ValueError):
+        return None
+    if quota_us <= 0 or period_us <= 0:
+        return None
+    return max(1, math.ceil(quota_us / period_us))
+
+
+def _prefetch_sources(files: list[Path]) -> Iterator[tuple[Path, bytes | None]]:
+    # Reads release the GIL, so disk latency overlaps with parsing.
+    with ThreadPoolExecutor(max_workers=SERIAL_SCAN_READ_WORKERS) as readers:
+        upcoming = iter(files)
+        window: deque[tuple[Path, Future[bytes | None]]] = deque(
+            (py_file, readers.submit(_read_source, py_file))
+            for py_file in islice(upcoming, SERIAL_SCAN_READ_AHEAD)
+        )
+        while window:
+            py_file, pending = window.popleft()
+            for next_file in islice(upcoming, 1):
+                window.append((next_file, readers.submit(_read_source, next_file)))
+            yield py_file, pending.result()
+
+
 class NotebookDetector:
     source_type = "jupyter_notebook"
 
@@ -361,11 +772,12 @@ class NotebookDetector:
         scanned = 0
         for notebook in candidates:
             try:
-                payload = json.loads(notebook.read_text(encoding="utf-8"))
+                # Third-party input: nbformat and the stdlib write NaN/Infinity into outputs.
+                payload = json.loads(notebook.read_bytes())
             except Exception:
                 continue
             scanned += 1
-            rel = notebook.relative_to(context.target_dir)
+            rel = display_path(notebook.relative_to(context.target_dir))
             cells = payload.get("cells", [])
             for idx, cell in enumerate(cells):
                 if cell.get("cell_type") != "code":
@@ -405,7 +817,7 @@ class ConfigFileDetector:
         candidates = _config_candidates(context.target_dir)
         scanned = 0
         for file_path in candidates:
-            rel = file_path.relative_to(context.target_dir)
+            rel = display_path(file_path.relative_to(context.target_dir))
             text = _safe_read_text(file_path)
             if not text:
                 continue
@@ -518,7 +930,7 @@ class RuntimeManifestDetector:
         candidates = _runtime_manifest_candidates(context.target_dir)
         scanned = 0
         for file_path in candidates:
-            rel = file_path.relative_to(context.target_dir)
+            rel = display_path(file_path.relative_to(context.target_dir))
             text = _safe_read_text(file_path)
             if not text:
                 continue
@@ -538,9 +950,9 @@ class RuntimeManifestDetector:
                     )
                 )
                 for dep in deps:
-                    for fw, aliases in FRAMEWORK_ALIASES.items():
-                        if dep.lower() in aliases:
-                            result.frameworks.add(fw)
+                    fw = FRAMEWORK_BY_ALIAS.get(dep.lower())
+                    if fw is not None:
+                        result.frameworks.add(fw)
 
             runtime_context = _runtime_context_from_manifest(file_path.name, text)
             result.runtime_context = _merge_provenance(result.runtime_context, runtime_context)
@@ -621,7 +1033,7 @@ class JSTSPackageManifestDetector:
         candidates = _js_ts_manifest_candidates(context.target_dir)
         scanned = 0
         for manifest in candidates:
-            rel = manifest.relative_to(context.target_dir)
+            rel = display_path(manifest.relative_to(context.target_dir))
             text = _safe_read_text(manifest)
             if not text:
                 continue
@@ -640,9 +1052,9 @@ class JSTSPackageManifestDetector:
                     )
                 )
                 for dep in deps:
-                    for fw, aliases in FRAMEWORK_ALIASES.items():
-                        if dep.lower() in aliases:
-                            result.frameworks.add(fw)
+                    fw = FRAMEWORK_BY_ALIAS.get(dep.lower())
+                    if fw is not None:
+                        result.frameworks.add(fw)
         result.coverage = {
             "source_type": self.source_type,
             "artifacts_seen": len(candidates),
@@ -653,22 +1065,31 @@ class JSTSPackageManifestDetector:
 
 
 def _dedupe(items: list[dict[str, Any]], keys: list[str]) -> list[dict[str, Any]]:
-    seen: set[tuple[str, ...]] = set()
-    out: list[dict[str, Any]] = []
+    first_seen: dict[tuple[str, ...], dict[str, Any]] = {}
     for item in items:
-        marker = tuple(str(item.get(k, "")) for k in keys)
-        if marker not in seen:
-            seen.add(marker)
-            out.append(item)
-    return sorted(out, key=lambda x: stable_json(x))
+        first_seen.setdefault(tuple(str(item.get(k, "")) for k in keys), item)
+    # Markers are unique dict keys, so ordering on them alone is total and stable.
+    return [first_seen[marker] for marker in sorted(first_seen)]
 
 
 def find_python_files(target: Path) -> list[Path]:
-    ignored = {".venv", "venv", "__pycache__", ".git", ".aibom"}
-    return sorted(
-        [p for p in target.rglob("*.py") if not any(part in ignored for part in p.parts)],
-        key=lambda p: str(p),
-    )
+    found: list[str] = []
+    pending = [os.fspath(target)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                # Ignored trees (virtualenvs, .git) are pruned before they are ever opened.
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in IGNORED_DIRS:
+                        pending.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    found.append(entry.path)
+    found.sort()
+    return [Path(path) for path in found]
 
 
 def generate_aibom(
@@ -678,6 +1099,7 @@ def generate_aibom(
     redaction_policy: str = "strict",
     risk_policy_path: Path | None = None,
     extra_detectors: list[SourceDetector] | None = None,
+    cache_dir: Path | None = None,
 ) -> dict[str, Any]:
     normalized_policy = redaction_policy.lower()
     if normalized_policy not in REDUCTION_POLICIES:
@@ -689,6 +1111,7 @@ def generate_aibom(
         include_prompts=include_prompts,
         include_runtime_manifests=include_runtime_manifests,
         redaction_policy=normalized_policy,
+        cache_dir=cache_dir,
     )
     detectors: list[SourceDetector] = [
         PythonAstDetector(),
@@ -781,7 +1204,7 @@ def generate_aibom(
     risk_findings, risk_policy = generate_risk_findings(doc, policy_path=risk_policy_path)
     doc["risk_findings"] = risk_findings
     doc["risk_policy"] = risk_policy
-    artifact_hash = sha256_bytes(stable_json(doc).encode("utf-8"))
+    artifact_hash = sha256_bytes(canonical_json_bytes(doc))
     doc["metadata"]["artifact_sha256"] = artifact_hash
     return doc
 
@@ -940,7 +1363,7 @@ def _unsupported_artifacts(target: Path) -> list[dict[str, str]]:
         if p.suffix.lower() in unsupported_ext:
             out.append(
                 {
-                    "path": str(p.relative_to(target)),
+                    "path": display_path(p.relative_to(target)),
                     "artifact_type": p.suffix.lower(),
                     "reason": "No enabled detector covers this source artifact type.",
                 }
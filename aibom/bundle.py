@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import re
 import subprocess
 import tempfile
@@ -8,44 +7,83 @@ from collections.abc import Callable
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
 
 from aibom.diffing import diff_aibom
 from aibom.exporters import export_spdx
 from aibom.storage import load_json
 from aibom.utils import (
+    canonical_json_bytes,
     environment_capture,
     sha256_bytes,
-    stable_json,
+    stable_json_bytes,
     validate_safe_path,
 )
 
+# Earliest timestamp the zip format can represent.
+BUNDLE_ENTRY_DATE_TIME = (1980, 1, 1, 0, 0, 0)
 
-def build_manifest(files: dict[str, bytes]) -> dict[str, str]:
-    return {name: sha256_bytes(content) for name, content in sorted(files.items())}
+# Bundle entries are small JSON documents; zlib level 1 compresses them nearly as well as 6.
+BUNDLE_COMPRESSION: dict[str, tuple[int, int | None]] = {
+    "fast": (ZIP_DEFLATED, 1),
+    "balanced": (ZIP_DEFLATED, 6),
+    "store": (ZIP_STORED, None),
+}
 
 
 def create_bundle(
-    aibom_path: Path, out_zip: Path, baseline_path: Path | None = None, compliance_md: str = ""
+    aibom_path: Path,
+    out_zip: Path,
+    baseline_path: Path | None = None,
+    compliance_md: str = "",
+    compression: str = "fast",
 ) -> Path:
-    aibom = load_json(aibom_path)
-    files: dict[str, bytes] = {}
-    files["AIBOM.json"] = stable_json(aibom).encode("utf-8")
-    files["SPDX.json"] = stable_json(export_spdx(aibom)).encode("utf-8")
-    if baseline_path and baseline_path.exists():
-        baseline = load_json(baseline_path)
-        files["DIFF.json"] = stable_json(diff_aibom(baseline, aibom)).encode("utf-8")
-    files["ENVIRONMENT.json"] = stable_json(environment_capture()).encode("utf-8")
-    files["COMPLIANCE_MAPPING.md"] = compliance_md.encode("utf-8")
-    manifest = build_manifest(files)
-    files["MANIFEST.json"] = stable_json(manifest).encode("utf-8")
-
-    with ZipFile(out_zip, "w", compression=ZIP_DEFLATED) as zf:
-        for name in sorted(files):
-            zf.writestr(name, files[name])
+    return create_bundle_from_doc(
+        load_json(aibom_path), out_zip, baseline_path, compliance_md, compression=compression
+    )
+
+
+def create_bundle_from_doc(
+    aibom: dict[str, Any],
+    out_zip: Path,
+    baseline_path: Path | None = None,
+    compliance_md: str = "",
+    spdx: dict[str, Any] | None = None,
+    compression: str = "fast",
+) -> Path:
+    """Bundle an in-memory AIBOM, reusing an already-computed SPDX export when given.
+
+    JSON entries are compact canonical JSON (sorted keys, no whitespace). Entries are
+    written and hashed one at a time; MANIFEST.json goes last.
+    """
+    if compression not in BUNDLE_COMPRESSION:
+        raise ValueError(f"Unsupported bundle compression: {compression}")
+    compress_type, compresslevel = BUNDLE_COMPRESSION[compression]
+    manifest: dict[str, str] = {}
+    with ZipFile(out_zip, "w", compression=compress_type, compresslevel=compresslevel) as zf:
+
+        def add(name: str, content: bytes) -> None:
+            manifest[name] = _write_bundle_entry(zf, name, content)
+
+        add("AIBOM.json", canonical_json_bytes(aibom))
+        add("COMPLIANCE_MAPPING.md", compliance_md.encode("utf-8"))
+        if baseline_path and baseline_path.exists():
+            add("DIFF.json", canonical_json_bytes(diff_aibom(load_json(baseline_path), aibom)))
+        add("ENVIRONMENT.json", canonical_json_bytes(environment_capture()))
+        add("SPDX.json", canonical_json_bytes(spdx if spdx is not None else export_spdx(aibom)))
+        _write_bundle_entry(zf, "MANIFEST.json", canonical_json_bytes(manifest))
     return out_zip
 
 
+def _write_bundle_entry(zf: ZipFile, name: str, content: bytes) -> str:
+    # Fixed timestamp and mode keep bundles byte-reproducible for identical inputs.
+    info = ZipInfo(name, date_time=BUNDLE_ENTRY_DATE_TIME)
+    info.compress_type = zf.compression
+    info.external_attr = 0o644 << 16
+    zf.writestr(info, content, compresslevel=zf.compresslevel)
+    return sha256_bytes(content)
+
+
 def _openssl(args: list[str]) -> subprocess.CompletedProcess[str]:
     return subprocess.run(["openssl", *args], check=True, text=True, capture_output=True)
 
@@ -250,7 +288,7 @@ def sign_bundle(
             "checks": {},
         },
     }
-    provenance_path.write_text(stable_json(provenance), encoding="utf-8")
+    provenance_path.write_bytes(stable_json_bytes(provenance))
     return signature_path, provenance_path
 
 
@@ -332,7 +370,7 @@ def verify_bundle_signature(
         pubkey_path.unlink(missing_ok=True)
 
     if safe_provenance_path:
-        provenance = json.loads(safe_provenance_path.read_text(encoding="utf-8"))
+        provenance = load_json(safe_provenance_path)
         expected_bundle = provenance.get("bundle", {}).get("sha256")
         expected_sig = provenance.get("signature", {}).get("sha256")
         expected_fp = provenance.get("certificate", {}).get("sha256_fingerprint")
@@ -356,7 +394,7 @@ def verify_bundle_signature(
 
     if provenance_path:
         if safe_provenance_path:
-            provenance = json.loads(safe_provenance_path.read_text(encoding="utf-8"))
+            provenance = load_json(safe_provenance_path)
         else:
             provenance = {
                 "attestation_type": "aibom-bundle-signature/v1",
@@ -368,4 +406,4 @@ def verify_bundle_signature(
             "checks": policy_checks,
         }
         if safe_provenance_path:
-            safe_provenance_path.write_text(stable_json(provenance), encoding="utf-8")
+            safe_provenance_path.write_bytes(stable_json_bytes(provenance))
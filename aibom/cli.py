@@ -6,19 +6,25 @@ import sys
 from pathlib import Path
 
 from aibom import __version__
-from aibom.analyzer import generate_aibom
-from aibom.bundle import create_bundle, sign_bundle, verify_bundle_signature
+from aibom.analyzer import default_scan_cache_dir, generate_aibom, prune_scan_cache
+from aibom.bundle import (
+    BUNDLE_COMPRESSION,
+    create_bundle,
+    create_bundle_from_doc,
+    sign_bundle,
+    verify_bundle_signature,
+)
 from aibom.diffing import diff_aibom, gate_failures, trend_diff_aibom
 from aibom.exporters import export_cyclonedx, export_sarif, export_spdx, export_vex
 from aibom.github_scan import _load_repos, scan_github_repos
 from aibom.presentation import (
     build_ai_bom_like_profile,
-    profile_json_dumps,
+    profile_json_bytes,
     render_text_summary,
 )
 from aibom.risk.heuristics import generate_risk_findings
 from aibom.storage import load_json, list_run_history, persist_periodic_snapshot, persist_run
-from aibom.utils import stable_json
+from aibom.utils import stable_json_bytes
 from aibom.validation import AIBOMValidationException, validate_aibom
 
 
@@ -26,7 +32,7 @@ COMPLIANCE_STARTER = """# Starter Compliance Mapping\n\nThis mapping is a starte
 
 
 def _write_json(path: Path, data: dict) -> None:
-    path.write_text(stable_json(data), encoding="utf-8")
+    path.write_bytes(stable_json_bytes(data))
 
 
 def _parse_allowlist(args: argparse.Namespace) -> dict[str, list[str]] | None:
@@ -65,13 +71,17 @@ def cmd_generate(args: argparse.Namespace) -> int:
     out = Path(args.output).resolve()
     risk_policy_path = Path(args.risk_policy).resolve() if args.risk_policy else None
 
+    cache_dir = None if args.no_cache else default_scan_cache_dir()
     aibom = generate_aibom(
         target,
         include_prompts=args.include_prompts,
         include_runtime_manifests=args.include_runtime_manifests,
         redaction_policy=args.redaction_policy,
         risk_policy_path=risk_policy_path,
+        cache_dir=cache_dir,
     )
+    if cache_dir is not None:
+        prune_scan_cache(cache_dir)
     try:
         validate_aibom(aibom)
     except AIBOMValidationException as exc:
@@ -88,26 +98,29 @@ def cmd_generate(args: argparse.Namespace) -> int:
             )
             return 2
 
-    _write_json(out, aibom)
+    aibom_bytes = stable_json_bytes(aibom)
+    out.write_bytes(aibom_bytes)
 
     if args.profile == "ai-bom-like":
         profile_out = out.with_name(f"{out.stem}_ai_profile.json")
         profile_doc = build_ai_bom_like_profile(aibom)
-        profile_out.write_text(profile_json_dumps(profile_doc), encoding="utf-8")
+        profile_out.write_bytes(profile_json_bytes(profile_doc))
         print(render_text_summary(aibom))
 
-    persist_run(target, aibom)
+    persist_run(target, aibom, payload=aibom_bytes)
 
     if args.audit_mode:
         spdx_out = out.with_name("SPDX.json")
-        _write_json(spdx_out, export_spdx(aibom))
+        spdx = export_spdx(aibom)
+        _write_json(spdx_out, spdx)
         if args.bundle_out:
             baseline = target / ".aibom" / "baseline.json"
-            create_bundle(
-                out,
+            create_bundle_from_doc(
+                aibom,
                 Path(args.bundle_out).resolve(),
                 baseline if baseline.exists() else None,
                 COMPLIANCE_STARTER,
+                spdx=spdx,
             )
     return 0
 
@@ -182,7 +195,13 @@ def cmd_diff(args: argparse.Namespace) -> int:
 
 def cmd_bundle(args: argparse.Namespace) -> int:
     baseline = Path(args.baseline) if args.baseline else None
-    bundle_path = create_bundle(Path(args.input), Path(args.out), baseline, COMPLIANCE_STARTER)
+    bundle_path = create_bundle(
+        Path(args.input),
+        Path(args.out),
+        baseline,
+        COMPLIANCE_STARTER,
+        compression=args.compress,
+    )
     if args.sign:
         if not args.signing_key or not args.signing_cert:
             print("ERROR: --sign requires --signing-key and --signing-cert", file=sys.stderr)
@@ -360,6 +379,11 @@ def build_parser() -> argparse.ArgumentParser:
         type=int,
         help="Fail generation if unsupported artifact count is greater than this threshold.",
     )
+    gen.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-analyze every Python file instead of reusing the per-user scan cache.",
+    )
     gen.set_defaults(func=cmd_generate)
 
     gh = sub.add_parser(
@@ -455,6 +479,12 @@ def build_parser() -> argparse.ArgumentParser:
     b.add_argument("--signing-cert")
     b.add_argument("--signature-out")
     b.add_argument("--provenance-out")
+    b.add_argument(
+        "--compress",
+        choices=sorted(BUNDLE_COMPRESSION),
+        default="fast",
+        help="Zip compression for bundle entries (default: fast, zlib level 1).",
+    )
     b.set_defaults(func=cmd_bundle)
 
     a = sub.add_parser("attest")
@@ -5,6 +5,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
 
+from aibom.utils import display_path
+
 if TYPE_CHECKING:
     from aibom.analyzer import ScanContext
 
@@ -59,7 +61,7 @@ class JavaAstDetector:
             if not text:
                 continue
             scanned += 1
-            rel = source_file.relative_to(context.target_dir)
+            rel = display_path(source_file.relative_to(context.target_dir))
             for line_number, line in enumerate(text.splitlines(), start=1):
                 import_match = re.match(r"^\s*import\s+([^;]+);", line)
                 if import_match:
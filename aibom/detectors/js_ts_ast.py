@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from aibom.confidence import score_confidence
+from aibom.utils import display_path
 
 PROVENANCE_UNKNOWN = "unknown"
 
@@ -72,7 +73,7 @@ class JSTSAstDetector:
             if not text:
                 continue
             scanned += 1
-            rel = source_file.relative_to(context.target_dir)
+            rel = display_path(source_file.relative_to(context.target_dir))
             parser = _JSTSParser(text)
             parsed = parser.parse()
 
@@ -13,13 +13,19 @@ def diff_aibom(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
     for sec, k in sections.items():
         old_i = _index(old.get(sec, []), k)
         new_i = _index(new.get(sec, []), k)
-        added = [new_i[x] for x in sorted(new_i.keys() - old_i.keys())]
-        removed = [old_i[x] for x in sorted(old_i.keys() - new_i.keys())]
-        changed = [
-            {"before": old_i[x], "after": new_i[x]}
-            for x in sorted(new_i.keys() & old_i.keys())
-            if old_i[x] != new_i[x]
-        ]
+        added: list[dict[str, Any]] = []
+        removed: list[dict[str, Any]] = []
+        changed: list[dict[str, Any]] = []
+        # One sorted pass over the key union classifies every entry.
+        for x in sorted(old_i.keys() | new_i.keys()):
+            before = old_i.get(x)
+            after = new_i.get(x)
+            if before is None:
+                added.append(after)
+            elif after is None:
+                removed.append(before)
+            elif before != after:
+                changed.append({"before": before, "after": after})
         out["added"][sec] = added
         out["removed"][sec] = removed
         out["changed"][sec] = changed
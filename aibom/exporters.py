@@ -4,7 +4,9 @@ import hashlib
 import json
 import re
 import uuid
+from collections import defaultdict
 from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Any
 
 from aibom import __version__
@@ -135,6 +137,11 @@ def export_spdx(aibom: dict[str, Any]) -> dict[str, Any]:
     package_ids_by_name: dict[str, str] = {}
     finding_by_source = _finding_metadata_by_source(aibom.get("scan_findings", []))
     risk_findings = sorted(aibom.get("risk_findings", []), key=lambda item: str(item.get("id", "")))
+    risk_ids_by_source: dict[str, list[str]] = defaultdict(list)
+    for risk_finding in risk_findings:
+        risk_ids_by_source[_extract_risk_source_file(risk_finding)].append(
+            str(risk_finding.get("id", "unknown"))
+        )
 
     def add_package(
         kind: str,
@@ -187,16 +194,14 @@ def export_spdx(aibom: dict[str, Any]) -> dict[str, Any]:
                     },
                 ]
             )
-        for risk_finding in risk_findings:
-            if _extract_risk_source_file(risk_finding) != (source_file or ""):
-                continue
-            refs.append(
-                {
-                    "referenceCategory": "SECURITY",
-                    "referenceType": "advisory",
-                    "referenceLocator": f"aibom-risk:{risk_finding.get('id', 'unknown')}",
-                }
-            )
+        refs.extend(
+            {
+                "referenceCategory": "SECURITY",
+                "referenceType": "advisory",
+                "referenceLocator": f"aibom-risk:{risk_id}",
+            }
+            for risk_id in risk_ids_by_source.get(source_file or "", [])
+        )
         if refs:
             package["externalRefs"] = refs
         packages.append(package)
@@ -232,7 +237,7 @@ def export_spdx(aibom: dict[str, Any]) -> dict[str, Any]:
             framework.get("source_file"),
         )
 
-    packages = sorted(packages, key=lambda x: x["SPDXID"])
+    packages.sort(key=itemgetter("SPDXID"))
     document_describes = [pkg["SPDXID"] for pkg in packages]
     relationships: list[dict[str, str]] = [
         {
@@ -342,7 +347,12 @@ def export_cyclonedx(aibom: dict[str, Any]) -> dict[str, Any]:
             framework.get("source_file"),
         )
 
-    components = sorted(components, key=lambda x: x["bom-ref"])
+    components.sort(key=itemgetter("bom-ref"))
+    component_refs_by_source: dict[str, list[str]] = defaultdict(list)
+    for component in components:
+        for prop in component["properties"]:
+            if prop["name"] == "aibom:source_file":
+                component_refs_by_source[prop["value"]].append(component["bom-ref"])
     dependency_names = _parse_dependency_names(aibom.get("scan_findings", []))
     depends_on = [
         refs_by_name[name.lower()] for name in dependency_names if name.lower() in refs_by_name
@@ -355,14 +365,7 @@ def export_cyclonedx(aibom: dict[str, Any]) -> dict[str, Any]:
         source_file = _extract_risk_source_file(risk_finding)
         affects = []
         if source_file:
-            affects = [
-                {"ref": component["bom-ref"]}
-                for component in components
-                if any(
-                    prop.get("name") == "aibom:source_file" and prop.get("value") == source_file
-                    for prop in component.get("properties", [])
-                )
-            ]
+            affects = [{"ref": ref} for ref in component_refs_by_source.get(source_file, [])]
         vulnerabilities.append(
             {
                 "id": str(risk_finding.get("id", "unknown")),
@@ -481,7 +484,7 @@ def export_sarif(aibom: dict[str, Any]) -> dict[str, Any]:
                     "driver": {
                         "name": "aibom",
                         "version": __version__,
-                        "rules": sorted(rules.values(), key=lambda item: item["id"]),
+                        "rules": sorted(rules.values(), key=itemgetter("id")),
                     }
                 },
                 "invocations": [{"endTimeUtc": timestamp}],
@@ -12,11 +12,11 @@ from aibom.analyzer import generate_aibom
 from aibom.diffing import diff_aibom, gate_failures
 from aibom.presentation import (
     build_ai_bom_like_profile,
-    profile_json_dumps,
+    profile_json_bytes,
     render_markdown_summary,
 )
 from aibom.storage import load_json
-from aibom.utils import stable_json, validate_safe_path
+from aibom.utils import stable_json_bytes, validate_safe_path
 from aibom.validation import validate_aibom
 
 
@@ -144,12 +144,12 @@ def scan_github_repos(
                     risk_policy_path=risk_policy_path,
                 )
                 validate_aibom(aibom)
-                canonical_output.write_text(stable_json(aibom), encoding="utf-8")
+                canonical_output.write_bytes(stable_json_bytes(aibom))
 
                 profile_path_str: str | None = None
                 if profile == "ai-bom-like":
                     ai_profile = build_ai_bom_like_profile(aibom)
-                    profile_output.write_text(profile_json_dumps(ai_profile), encoding="utf-8")
+                    profile_output.write_bytes(profile_json_bytes(ai_profile))
                     profile_path_str = str(profile_output.relative_to(output_dir))
 
                 failures: list[str] = []
@@ -212,7 +212,7 @@ def scan_github_repos(
         "failed_repositories": global_failures,
         "records": [asdict(record) for record in records],
     }
-    (output_dir / "summary.json").write_text(stable_json(summary), encoding="utf-8")
+    (output_dir / "summary.json").write_bytes(stable_json_bytes(summary))
     (output_dir / "SUMMARY.md").write_text(
         render_markdown_summary(summary["records"]),
         encoding="utf-8",
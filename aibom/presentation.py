@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
+from aibom.utils import stable_json_bytes
 
 DEFAULT_TOP_RISKS = 3
 
@@ -208,5 +208,5 @@ def render_markdown_summary(records: list[dict[str, Any]]) -> str:
     return "\n".join(lines) + "\n"
 
 
-def profile_json_dumps(data: dict[str, Any]) -> str:
-    return json.dumps(data, indent=2, sort_keys=True)
+def profile_json_bytes(data: dict[str, Any]) -> bytes:
+    return stable_json_bytes(data)
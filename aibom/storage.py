@@ -4,17 +4,19 @@ import json
 from pathlib import Path
 from typing import Any
 
-from aibom.utils import git_sha, stable_json, utc_now
+from aibom.utils import git_sha, orjson, stable_json_bytes, utc_now
 
 
-def persist_run(target_dir: Path, aibom: dict[str, Any]) -> Path:
+def persist_run(target_dir: Path, aibom: dict[str, Any], payload: bytes | None = None) -> Path:
     run_dir = target_dir / ".aibom" / "runs"
     run_dir.mkdir(parents=True, exist_ok=True)
     filename = f"{utc_now()}_{git_sha(target_dir)[:12]}.json"
     out = run_dir / filename
-    out.write_text(stable_json(aibom), encoding="utf-8")
+    if payload is None:
+        payload = stable_json_bytes(aibom)
+    out.write_bytes(payload)
     latest = target_dir / ".aibom" / "latest.json"
-    latest.write_text(stable_json(aibom), encoding="utf-8")
+    latest.write_bytes(payload)
     return out
 
 
@@ -47,12 +49,12 @@ def persist_periodic_snapshot(
         "drift": drift,
     }
     out = snapshots_dir / f"{timestamp}.json"
-    out.write_text(stable_json(payload), encoding="utf-8")
+    out.write_bytes(stable_json_bytes(payload))
 
     history_index = snapshots_dir / "history.json"
     history: dict[str, Any] = {"snapshots": []}
     if history_index.exists():
-        history = json.loads(history_index.read_text(encoding="utf-8"))
+        history = load_json(history_index)
     history.setdefault("snapshots", []).append(
         {
             "snapshot": out.name,
@@ -63,9 +65,16 @@ def persist_periodic_snapshot(
         }
     )
     history["snapshots"] = history["snapshots"][-200:]
-    history_index.write_text(stable_json(history), encoding="utf-8")
+    history_index.write_bytes(stable_json_bytes(history))
     return out
 
 
 def load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    # Accept exactly what orjson does: strict UTF-8 without a BOM, and no NaN/Infinity.
+    return json.loads(path.read_bytes().decode("utf-8"), parse_constant=_reject_constant)
+
+
+def _reject_constant(name: str) -> Any:
+    raise ValueError(f"{name} is not valid JSON")
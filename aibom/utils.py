@@ -11,11 +11,26 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ModuleNotFoundError:  # optional speedup, see the `speedups` extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Characters dangerous in shell contexts that should be rejected
 _SHELL_METACHARACTERS = frozenset(";&|`$(){}[]!\"'\\<>\n\r")
 
+# Upper bound for `git rev-parse HEAD`; a hung or locked repository reports "unknown"
+GIT_SHA_TIMEOUT_SEC = 2
+
+# Resolved directory -> HEAD SHA for successful lookups, oldest evicted first
+_GIT_SHA_CACHE: dict[str, str] = {}
+_GIT_SHA_CACHE_SIZE = 8
+
+# Read size for streaming file hashes on interpreters without hashlib.file_digest
+_HASH_CHUNK_SIZE = 1 << 20
+
 
 class PathSecurityError(ValueError):
     """Raised when a path fails security validation."""
@@ -95,8 +110,38 @@ def validate_safe_path(
     return abs_path
 
 
+def stable_json_bytes(data: Any) -> bytes:
+    """Serialize ``data`` as sorted, indented UTF-8 JSON bytes for files people read.
+
+    Uses orjson when installed. Its float spelling (``1e-05`` vs ``1e-5``) differs from the
+    stdlib's, so these bytes are never hashed; see ``canonical_json_bytes``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
+        except TypeError:
+            # Non-str keys, oversized ints and lone surrogates: the stdlib encoder copes.
+            pass
+    return _utf8(json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False))
+
+
+def canonical_json_bytes(data: Any) -> bytes:
+    """Serialize ``data`` as sorted, compact UTF-8 JSON bytes.
+
+    This is the form that is hashed and bundled. It is always produced by the stdlib encoder,
+    so digests do not depend on whether the ``speedups`` extra is installed.
+    """
+    return _utf8(json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False))
+
+
+def _utf8(text: str) -> bytes:
+    # Lone surrogates (a "\udcff" string literal, a surrogateescape-decoded path) can only occur
+    # inside JSON strings, where backslashreplace writes the matching \uXXXX escape.
+    return text.encode("utf-8", "backslashreplace")
+
+
 def stable_json(data: Any) -> str:
-    return json.dumps(data, indent=2, sort_keys=True)
+    return stable_json_bytes(data).decode("utf-8")
 
 
 def sha256_bytes(content: bytes) -> str:
@@ -104,7 +149,18 @@ def sha256_bytes(content: bytes) -> str:
 
 
 def sha256_file(path: Path) -> str:
-    return sha256_bytes(path.read_bytes())
+    with path.open("rb", buffering=0) as handle:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def display_path(path: Path) -> str:
+    """Text form of ``path`` for reports; bytes that are not UTF-8 become ``\\xNN`` escapes."""
+    return os.fsencode(path).decode("utf-8", "backslashreplace")
 
 
 def utc_now() -> str:
@@ -112,24 +168,36 @@ def utc_now() -> str:
 
 
 def git_sha(cwd: Path) -> str:
-    """Get git SHA with path validation."""
+    """Get git SHA with path validation; successful lookups are cached per resolved directory."""
     try:
         # Validate the working directory path
         safe_cwd = validate_safe_path(cwd, must_exist=True, must_be_dir=True)
-
-        out = subprocess.check_output(
-            ["git", "rev-parse", "HEAD"],
-            cwd=str(safe_cwd),
-            text=True,
-            stderr=subprocess.PIPE,
-        ).strip()
-        return out
     except PathSecurityError as e:
         logger.warning("Path security error for git SHA: %s", e)
         return "unknown"
+
+    key = str(safe_cwd)
+    cached = _GIT_SHA_CACHE.get(key)
+    if cached is not None:
+        return cached
+    try:
+        proc = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=key,
+            text=True,
+            capture_output=True,
+            check=True,
+            timeout=GIT_SHA_TIMEOUT_SEC,
+        )
     except (subprocess.SubprocessError, OSError) as e:
+        # Not cached: a timeout or a repository created later must not stick for the process.
         logger.warning("Failed to get git SHA in %s: %s", cwd, e)
         return "unknown"
+    sha = proc.stdout.strip()
+    if len(_GIT_SHA_CACHE) >= _GIT_SHA_CACHE_SIZE:
+        del _GIT_SHA_CACHE[next(iter(_GIT_SHA_CACHE))]
+    _GIT_SHA_CACHE[key] = sha
+    return sha
 
 
 def environment_capture() -> dict[str, Any]:
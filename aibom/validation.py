@@ -12,6 +12,8 @@ AIBOM_SCHEMA_VERSION = "1.0"
 ALLOWED_SCHEMA_VERSIONS = {AIBOM_SCHEMA_VERSION}
 DEFAULT_SCHEMA_PATH = Path(__file__).parent / "schema" / "aibom_v1.json"
 
+_REQUIRED_MSG = re.compile(r"'([^']+)' is a required property")
+
 
 class AIBOMValidationException(ValueError):
     """Raised when an AIBOM document fails schema validation."""
@@ -35,7 +37,7 @@ def _json_pointer(path: list[Any]) -> str:
 def _error_pointer(err: Any) -> str:
     base_path = list(err.absolute_path)
     if err.validator == "required":
-        missing_match = re.search(r"'([^']+)' is a required property", err.message)
+        missing_match = _REQUIRED_MSG.search(err.message)
         if missing_match:
             base_path.append(missing_match.group(1))
     return _json_pointer(base_path)
@@ -65,8 +67,8 @@ def validate_aibom(doc: dict[str, Any], schema_path: object | None = None) -> No
         )
 
     validator = _build_validator(str(resolved))
-    errors = sorted(validator.iter_errors(doc), key=lambda e: (_error_pointer(e), e.message))
+    first = min(((_error_pointer(e), e.message) for e in validator.iter_errors(doc)), default=None)
 
-    if errors:
-        first = errors[0]
-        raise AIBOMValidationException(_error_pointer(first), first.message)
+    if first is not None:
+        pointer, message = first
+        raise AIBOMValidationException(pointer, message)
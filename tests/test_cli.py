@@ -2,17 +2,40 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import subprocess
 import sys
+import time
 import zipfile
 from pathlib import Path
 
 import pytest
 
-from aibom.analyzer import generate_aibom
-from aibom.bundle import create_bundle, verify_bundle_signature
+from aibom.analyzer import (
+    CALL_HINT_KINDS,
+    PARALLEL_SCAN_MAX_WORKERS,
+    PARALLEL_SCAN_MIN_FILES,
+    PREFILTERED_SCAN,
+    SCAN_CACHE_MAX_AGE_SEC,
+    SCAN_WORKERS_ENV,
+    _analyze_file,
+    _analyze_files,
+    find_python_files,
+    generate_aibom,
+    prune_scan_cache,
+    scan_worker_count,
+)
+from aibom.bundle import create_bundle, create_bundle_from_doc, verify_bundle_signature
 from aibom.diffing import diff_aibom, trend_diff_aibom
 from aibom.exporters import export_spdx
+from aibom.storage import load_json
+from aibom.utils import (
+    GIT_SHA_TIMEOUT_SEC,
+    canonical_json_bytes,
+    git_sha,
+    sha256_bytes,
+    stable_json_bytes,
+)
 from aibom.validation import AIBOMValidationException, validate_aibom
 
 
@@ -207,6 +230,184 @@ def test_python_alias_binding_detection_for_models_and_tools() -> None:
     assert all(finding["confidence"] in {"medium", "high"} for finding in python_findings)
 
 
+def test_notebook_detector_accepts_nan_in_cell_outputs(tmp_path: Path) -> None:
+    cell = {
+        "cell_type": "code",
+        "source": ["from langchain_openai import ChatOpenAI\n", "ChatOpenAI(model='gpt-4o')\n"],
+        "outputs": [{"output_type": "execute_result", "data": {"score": float("nan")}}],
+    }
+    (tmp_path / "nb.ipynb").write_text(json.dumps({"cells": [cell]}), encoding="utf-8")
+
+    doc = generate_aibom(tmp_path)
+
+    assert [model["type"] for model in doc["models"]] == ["ChatOpenAI"]
+    coverage = next(
+        item
+        for item in doc["coverage_summary"]["detectors"]
+        if item["source_type"] == "jupyter_notebook"
+    )
+    assert coverage["artifacts_scanned"] == 1
+
+
+def test_find_python_files_prunes_ignored_directories(tmp_path: Path) -> None:
+    for rel in ("app/main.py", ".venv/lib/site.py", "node_modules/pkg/gyp.py", ".tox/py/x.py"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("import os\n", encoding="utf-8")
+
+    assert find_python_files(tmp_path) == [tmp_path / "app" / "main.py"]
+
+
+def test_python_visitor_handles_expressions_deeper_than_recursion_limit(tmp_path: Path) -> None:
+    terms = " + ".join(["1"] * 900)
+    source = f"from langchain_openai import ChatOpenAI\nx = {terms} + ChatOpenAI(model='m')\n"
+    (tmp_path / "deep.py").write_text(source, encoding="utf-8")
+
+    scan = _analyze_file(tmp_path / "deep.py", tmp_path, include_prompts=False)
+
+    assert scan is not None
+    assert [model["type"] for model in scan[0]] == ["ChatOpenAI"]
+
+
+def test_python_detector_parallel_scan_matches_serial(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Single-CPU runners would otherwise take the serial path.
+    monkeypatch.setenv(SCAN_WORKERS_ENV, "2")
+    file_count = PARALLEL_SCAN_MIN_FILES + 4
+    for idx in range(file_count):
+        source = f"from langchain_openai import ChatOpenAI\nllm = ChatOpenAI(model='gpt-{idx}')\n"
+        (tmp_path / f"mod_{idx:03d}.py").write_text(source, encoding="utf-8")
+    (tmp_path / "broken.py").write_text("from langchain_openai import (\n", encoding="utf-8")
+    files = find_python_files(tmp_path)
+
+    parallel = _analyze_files(files, tmp_path, include_prompts=False)
+    serial = [_analyze_file(py_file, tmp_path, include_prompts=False) for py_file in files]
+
+    assert parallel == serial
+    assert sum(scan is not None for scan in parallel) == file_count
+
+
+def test_scan_worker_count_honours_override_cgroup_quota_and_cap(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv(SCAN_WORKERS_ENV, raising=False)
+    monkeypatch.setattr("aibom.analyzer._CGROUP_ROOT", tmp_path)
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(64)), raising=False)
+    monkeypatch.setattr("aibom.analyzer.os.cpu_count", lambda: 64)
+
+    assert scan_worker_count() == PARALLEL_SCAN_MAX_WORKERS
+    (tmp_path / "cpu.max").write_text("150000 100000\n", encoding="ascii")
+    assert scan_worker_count() == 2
+    (tmp_path / "cpu.max").write_text("max 100000\n", encoding="ascii")
+    assert scan_worker_count() == PARALLEL_SCAN_MAX_WORKERS
+    monkeypatch.setenv(SCAN_WORKERS_ENV, "1")
+    assert scan_worker_count() == 1
+
+
+def test_python_prefilter_skips_sources_without_hint_names(tmp_path: Path) -> None:
+    (tmp_path / "plain.py").write_text("def helper():\n    return 1\n", encoding="utf-8")
+    (tmp_path / "broken.py").write_text("from langchain_openai import (\n", encoding="utf-8")
+    (tmp_path / "agent.py").write_text("runner = build_research_Agent()\n", encoding="utf-8")
+    # ASCII bytes whose utf-7 cookie decodes them to ``import langchain`` / ``ChatOpenAI(...)``.
+    (tmp_path / "utf7.py").write_bytes(
+        b"# coding: utf-7\nimport +AGw-angchain\nx = +AEM-hat+AE8-penAI(model='m')\n"
+    )
+
+    assert _analyze_file(tmp_path / "plain.py", tmp_path, include_prompts=False) == (
+        PREFILTERED_SCAN
+    )
+    agent_scan = _analyze_file(tmp_path / "agent.py", tmp_path, include_prompts=False)
+    assert agent_scan
+    assert [tool["name"] for tool in agent_scan[2]] == ["build_research_Agent"]
+    utf7_scan = _analyze_file(tmp_path / "utf7.py", tmp_path, include_prompts=False)
+    assert utf7_scan
+    assert [model["type"] for model in utf7_scan[0]] == ["ChatOpenAI"]
+    assert utf7_scan[4] == {"langchain"}
+
+    doc = generate_aibom(tmp_path)
+    coverage = next(
+        item for item in doc["coverage_summary"]["detectors"] if item["source_type"] == "python"
+    )
+    # Prefiltered files are reported apart; broken.py fails to parse and counts toward neither.
+    assert coverage["artifacts_seen"] == 4
+    assert coverage["artifacts_scanned"] == 2
+    assert coverage["artifacts_prefiltered"] == 1
+
+
+def test_generate_scan_cache_round_trip_matches_uncached(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+
+    uncached = generate_aibom(_fixture_project())
+    cold = generate_aibom(_fixture_project(), cache_dir=cache_dir)
+    warm = generate_aibom(_fixture_project(), cache_dir=cache_dir)
+
+    assert any(cache_dir.glob("*.json"))
+    for key in ("models", "datasets", "tools", "prompts", "frameworks"):
+        assert cold[key] == uncached[key]
+        assert warm[key] == uncached[key]
+
+
+def test_scan_cache_misses_when_hint_tables_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "app.py").write_text("import openai\nllm = MyNewLLM(model='m')\n")
+    cache_dir = tmp_path / "cache"
+
+    cold = _analyze_file(tmp_path / "app.py", tmp_path, False, cache_dir)
+    monkeypatch.setattr("aibom.analyzer.CALL_HINT_KINDS", {**CALL_HINT_KINDS, "MyNewLLM": "model"})
+    warm = _analyze_file(tmp_path / "app.py", tmp_path, False, cache_dir)
+
+    assert cold and cold[0] == []
+    assert warm and [model["type"] for model in warm[0]] == ["MyNewLLM"]
+
+
+def test_prune_scan_cache_evicts_unused_entries_once_per_interval(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    generate_aibom(_fixture_project(), cache_dir=cache_dir)
+    entries = sorted(cache_dir.glob("*.json"))
+    stale, fresh = entries[0], entries[1:]
+    old = time.time() - SCAN_CACHE_MAX_AGE_SEC - 60
+    os.utime(stale, (old, old))
+    (cache_dir / "keep.txt").write_text("not a cache entry", encoding="utf-8")
+    os.utime(cache_dir / "keep.txt", (old, old))
+
+    assert prune_scan_cache(cache_dir) == 1
+    assert sorted(cache_dir.glob("*.json")) == fresh
+    assert (cache_dir / "keep.txt").exists()
+
+    for entry in fresh:
+        os.utime(entry, (old, old))
+    assert prune_scan_cache(cache_dir) == 0
+
+
+def test_generate_handles_file_names_that_are_not_utf8(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    source = b"from langchain_openai import ChatOpenAI\nllm = ChatOpenAI(model='m')\n"
+    try:
+        with open(os.fsencode(project) + b"/m\xff.py", "wb") as handle:
+            handle.write(source)
+    except OSError:
+        pytest.skip("filesystem requires UTF-8 file names")
+
+    doc = generate_aibom(project, cache_dir=tmp_path / "cache")
+
+    assert [model["source_file"] for model in doc["models"]] == ["m\\xff.py"]
+    assert json.loads(canonical_json_bytes(doc)) == doc
+
+
+@pytest.mark.parametrize("orjson_installed", [True, False])
+def test_json_bytes_escape_lone_surrogates(
+    monkeypatch: pytest.MonkeyPatch, orjson_installed: bool
+) -> None:
+    if not orjson_installed:
+        monkeypatch.setattr("aibom.utils.orjson", None)
+    doc = {"template": "m\udcff"}
+
+    assert json.loads(stable_json_bytes(doc)) == doc
+    assert json.loads(canonical_json_bytes(doc)) == doc
+
+
 def test_js_ts_ast_alias_and_factory_detection_uses_ast_context() -> None:
     doc = generate_aibom(_fixture_project(), include_prompts=True)
 
@@ -437,6 +638,7 @@ def test_generate_fails_closed_before_writing_output(
             bundle_out=None,
             fail_on_unsupported_threshold=None,
             risk_policy=None,
+            no_cache=True,
         )
     )
 
@@ -561,6 +763,90 @@ def test_bundle_contains_manifest(tmp_path: Path) -> None:
     assert bundle_path.exists()
 
 
+def test_bundle_from_doc_matches_bundle_from_path(tmp_path: Path) -> None:
+    doc = generate_aibom(_fixture_project())
+    aibom_path = tmp_path / "aibom.json"
+    aibom_path.write_text(json.dumps(doc), encoding="utf-8")
+    from_path = create_bundle(aibom_path, tmp_path / "from_path.zip")
+    from_doc = create_bundle_from_doc(doc, tmp_path / "from_doc.zip")
+
+    with zipfile.ZipFile(from_path) as left, zipfile.ZipFile(from_doc) as right:
+        assert left.namelist() == right.namelist()
+        for name in ("AIBOM.json", "SPDX.json"):
+            assert left.read(name) == right.read(name)
+
+
+def test_bundle_entries_are_canonical_and_artifact_hash_recomputes(tmp_path: Path) -> None:
+    doc = generate_aibom(_fixture_project())
+    bundle_path = create_bundle_from_doc(doc, tmp_path / "evidence.zip")
+
+    with zipfile.ZipFile(bundle_path) as zf:
+        assert zf.read("AIBOM.json") == canonical_json_bytes(doc)
+    unhashed = json.loads(canonical_json_bytes(doc))
+    expected = unhashed["metadata"].pop("artifact_sha256")
+    assert sha256_bytes(canonical_json_bytes(unhashed)) == expected
+
+
+def test_canonical_json_bytes_do_not_depend_on_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    doc = {"weights": [0.00001, 1.538e-05, 1e16, 1e-7, 0.1], "name": "caf\u00e9"}
+    with_orjson = canonical_json_bytes(doc)
+    monkeypatch.setattr("aibom.utils.orjson", None)
+
+    assert canonical_json_bytes(doc) == with_orjson
+    assert json.loads(with_orjson) == doc
+
+
+@pytest.mark.parametrize("orjson_installed", [True, False])
+@pytest.mark.parametrize(
+    "payload", [b'\xef\xbb\xbf{"a": 1}', '{"a": 1}'.encode("utf-16"), b'{"a": NaN}']
+)
+def test_load_json_rejects_the_same_input_with_and_without_orjson(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, payload: bytes, orjson_installed: bool
+) -> None:
+    if not orjson_installed:
+        monkeypatch.setattr("aibom.storage.orjson", None)
+    path = tmp_path / "doc.json"
+    path.write_bytes(payload)
+
+    with pytest.raises(ValueError):
+        load_json(path)
+
+
+def test_bundle_store_compression_keeps_entries_uncompressed(tmp_path: Path) -> None:
+    doc = generate_aibom(_fixture_project())
+    bundle_path = create_bundle_from_doc(doc, tmp_path / "evidence.zip", compression="store")
+
+    with zipfile.ZipFile(bundle_path) as zf:
+        assert {info.compress_type for info in zf.infolist()} == {zipfile.ZIP_STORED}
+    with pytest.raises(ValueError):
+        create_bundle_from_doc(doc, tmp_path / "bad.zip", compression="zstd")
+
+
+def test_git_sha_caches_successes_only(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("aibom.utils._GIT_SHA_CACHE", {})
+    calls: list[dict[str, object]] = []
+    outcomes: list[object] = [subprocess.TimeoutExpired(["git"], 2), "abc123\n"]
+
+    def fake_run(cmd: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        calls.append(kwargs)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return subprocess.CompletedProcess(cmd, 0, stdout=outcome, stderr="")
+
+    monkeypatch.setattr("aibom.utils.subprocess.run", fake_run)
+
+    assert git_sha(tmp_path) == "unknown"
+    assert git_sha(tmp_path) == "abc123"
+    assert git_sha(tmp_path) == "abc123"
+    assert len(calls) == 2
+    assert all(call["timeout"] == GIT_SHA_TIMEOUT_SEC for call in calls)
+
+
+def test_git_sha_reports_unknown_for_invalid_paths() -> None:
+    assert git_sha(Path("bad\0dir")) == "unknown"
+
+
 def test_cli_version() -> None:
     proc = subprocess.run(
         [sys.executable, "-m", "aibom.cli", "--version"], capture_output=True, text=True, check=True